@@ -11,12 +11,17 @@ Rules (configurable below):
 - Allowed operators: +, -, *, %, ^ (exponent), ! (factorial), |x| (absolute value).
 - No division (by design). Modulo by zero is forbidden. Exponent bounds configurable.
 - Factorial only on nonnegative integers <= MAX_FACTORIAL_ARG.
+- Subexpressions with |value| > max_abs_value are pruned from the search. This is a
+  speed/completeness trade-off: an equation whose sides both exceed the cap is lost
+  (e.g. 8282: (8)! ^ 2 = (8)! ^ 2). Set it to None for the complete search.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from collections import defaultdict
+from functools import lru_cache
+import heapq
 from math import factorial as math_factorial, isclose
-from typing import List, Tuple, Iterable, Dict, Set
+from typing import List, Tuple, Iterable, Iterator, Dict, Set, NamedTuple, Optional
 
 # ==========================
 # RULES — tweak as you like
@@ -35,12 +40,45 @@ RULES: Dict = {
     "pow_max_exp": 6,             # cap exponent to keep search sane
     # Factorial constraints
     "max_factorial_arg": 8,       # cap n! (8! = 40320) — easy to change
+    # Prune any subexpression whose |value| exceeds this (None disables).
+    # Not sound: equations with both sides above the cap are dropped.
+    "max_abs_value": 10**6,
     # Apply unary ops (abs, fact) at any node? (kept true; space still tiny for 4 digits)
     "enable_unary_wrapping": True,
     # Numeric comparison tolerance for floats (we try to keep ints when possible)
     "eq_tol": 1e-9,
 }
 
+# RULES snapshot as plain globals so the hot loops skip dict lookups;
+# refreshed by apply_rules() at the start of every solve. The binary operator
+# flags are not snapshotted: they select what specialize_combine_binary() emits.
+ALLOW_ABS = ALLOW_FACT = UNARY_WRAPPING = POW_INT_EXP = True
+POW_MIN_EXP = POW_MAX_EXP = MAX_FACT = 0
+MAX_ABS_VAL: float | int = 0
+EQ_TOL = 0.0
+
+def apply_rules() -> None:
+    """Copy the current RULES into the module-level constants.
+
+    Also drops the memoized helpers whose results depend on those constants.
+    """
+    global ALLOW_ABS, ALLOW_FACT, UNARY_WRAPPING, POW_INT_EXP
+    global POW_MIN_EXP, POW_MAX_EXP, MAX_FACT, MAX_ABS_VAL, EQ_TOL
+    ALLOW_ABS = RULES["allow_abs"]
+    ALLOW_FACT = RULES["allow_fact"]
+    UNARY_WRAPPING = RULES["enable_unary_wrapping"]
+    POW_INT_EXP = RULES["pow_require_int_exp"]
+    POW_MIN_EXP = RULES["pow_min_exp"]
+    POW_MAX_EXP = RULES["pow_max_exp"]
+    MAX_FACT = RULES["max_factorial_arg"]
+    MAX_ABS_VAL = RULES["max_abs_value"]
+    if MAX_ABS_VAL is None:
+        MAX_ABS_VAL = float("inf")
+    EQ_TOL = RULES["eq_tol"]
+    safe_pow.cache_clear()
+    unary_value_closure.cache_clear()
+    specialize_combine_binary()
+
 # Pretty symbols for output
 SYM_PLUS = "+"
 SYM_MINUS = "-"
@@ -52,31 +90,55 @@ SYM_EQ = "="
 # ==========================
 # Core types
 # ==========================
-@dataclass(frozen=True)
-class Expr:
+class Node(NamedTuple):
     val: float | int
-    text: str
-    is_int: bool
-
-    def maybe_abs(self) -> Iterable["Expr"]:
-        if not RULES["allow_abs"]:
-            return []
-        v = abs(self.val)
-        txt = f"|{self.text}|"
-        return [Expr(as_int_if_possible(v), txt, is_integer(v))]
-
-    def maybe_fact(self) -> Iterable["Expr"]:
-        if not RULES["allow_fact"]:
-            return []
-        # only defined for nonnegative integers within bound
-        if not self.is_int:
-            return []
-        n = int(self.val)
-        if n < 0 or n > RULES["max_factorial_arg"]:
-            return []
-        v = math_factorial(n)
-        txt = f"({self.text})!"
-        return [Expr(as_int_if_possible(v), txt, True)]  # factorial result is int
+    op: str      # "" for a digit leaf, a binary symbol, or "abs" / "fact"
+    left: int    # child id (-1 for a leaf)
+    right: int   # right child id (-1 for leaves and unaries)
+
+class ExprPool:
+    """Hash-consed expression nodes; structurally identical nodes share one integer id."""
+
+    def __init__(self) -> None:
+        self.nodes: List[Node] = []
+        self.ids: Dict[Node, int] = {}
+
+    def intern(self, node: Node) -> int:
+        nid = self.ids.get(node)
+        if nid is None:
+            nid = len(self.nodes)
+            self.nodes.append(node)
+            self.ids[node] = nid
+        return nid
+
+    def clear(self) -> None:
+        self.nodes.clear()
+        self.ids.clear()
+
+    def render(self, nid: int) -> str:
+        """Build the display text of a node; only called for reported solutions."""
+        node = self.nodes[nid]
+        if not node.op:
+            return str(node.val)
+        if node.op == "abs":
+            return f"|{self.render(node.left)}|"
+        if node.op == "fact":
+            return f"({self.render(node.left)})!"
+        return f"({self.render(node.left)} {node.op} {self.render(node.right)})"
+
+POOL = ExprPool()
+
+class Expr:
+    __slots__ = ("val", "node", "is_int")
+
+    def __init__(self, val: float | int, node: int, is_int: bool) -> None:
+        self.val = val
+        self.node = node      # id in POOL; text is rendered lazily from it
+        self.is_int = is_int
+
+    @property
+    def text(self) -> str:
+        return POOL.render(self.node)
 
 # ==========================
 # Utilities
@@ -89,160 +151,335 @@ def as_int_if_possible(x: float | int) -> float | int:
         return int(x)
     return x
 
-def safe_pow(a: float | int, b: float | int) -> Tuple[bool, float | int]:
-    # power constraints
-    if RULES["pow_require_int_exp"] and not is_integer(b):
+@lru_cache(maxsize=4096, typed=True)
+def safe_pow(a: float | int, b: float | int, b_is_int: bool) -> Tuple[bool, float | int]:
+    # power constraints (b_is_int is the caller's int tag for b)
+    if POW_INT_EXP and not b_is_int:
+        return False, 0
+    if b_is_int and (b < POW_MIN_EXP or b > POW_MAX_EXP):
         return False, 0
-    b_int = int(b) if is_integer(b) else b
-    if isinstance(b_int, int):
-        if b_int < RULES["pow_min_exp"] or b_int > RULES["pow_max_exp"]:
-            return False, 0
     try:
-        v = a ** b_int
+        v = a ** b
     except Exception:
         return False, 0
     return True, v
 
-def combine_binary(L: Expr, R: Expr) -> Iterable[Expr]:
-    """Generate binary combinations (L op R) following rules."""
+# Every binary operator, one row each:
+#   (RULES flag, symbol name, setup statement, guard, value expression, result int tag)
+# Operands are a, b with int tags a_int, b_int (ab_int: both). The generated
+# combine_binary inlines the rows whose flag is enabled.
+ALL_OPS: Tuple[Tuple[str, str, str, str, str, str], ...] = (
+    ("allow_plus", "SYM_PLUS", "", "", "a + b", "ab_int"),
+    ("allow_minus", "SYM_MINUS", "", "", "a - b", "ab_int"),
+    ("allow_times", "SYM_TIMES", "", "", "a * b", "ab_int"),
+    ("allow_mod", "SYM_MOD", "", "ab_int and b != 0", "a % b", "True"),
+    ("allow_pow", "SYM_POW", "ok, v = safe_pow(a, b, b_int)", "ok", "v", "ab_int and b >= 0"),
+)
+
+def op_source() -> str:
+    """Body lines for the enabled ALL_OPS rows, appending (value, symbol) to out."""
+    lines: List[str] = []
+    for flag, sym, setup, guard, value, int_tag in ALL_OPS:
+        if not RULES[flag]:
+            continue
+        if setup:
+            lines.append(f"    {setup}")
+        indent = "    "
+        if guard:
+            lines.append(f"    if {guard}:")
+            indent = "        "
+        if value != "v":
+            lines.append(f"{indent}v = {value}")
+        # only results without a known int tag need as_int_if_possible
+        result = "v" if int_tag == "True" else f"(v if {int_tag} else as_int_if_possible(v))"
+        # prune values too large to be worth combining further
+        lines.append(f"{indent}if abs(v) <= MAX_ABS_VAL:")
+        lines.append(f"{indent}    out.append(({result}, {sym}))")
+    return "".join(line + "\n" for line in lines)
+
+def combine_binary(L: Expr, R: Expr) -> List[Tuple[float | int, str]]:
+    """(value, symbol) of each binary combination (L op R); replaced by apply_rules()."""
+    raise RuntimeError("combine_binary used before apply_rules()")
+
+def specialize_combine_binary() -> None:
+    """Generate combine_binary with only the enabled operators inlined and no RULES checks."""
+    global combine_binary
+    src = (
+        "def combine_binary(L, R):\n"
+        '    """(value, symbol) of each binary combination (L op R) following rules."""\n'
+        "    a = L.val\n"
+        "    b = R.val\n"
+        "    a_int = L.is_int\n"
+        "    b_int = R.is_int\n"
+        "    ab_int = a_int and b_int\n"
+        "    out = []\n"
+        + op_source()
+        + "    return out\n"
+    )
+    ns: Dict[str, object] = {}
+    exec(src, globals(), ns)
+    combine_binary = ns["combine_binary"]
+
+@lru_cache(maxsize=None)
+def factorial(n: int) -> int:
+    return math_factorial(n)
+
+def maybe_abs(v: float | int) -> Iterable[float | int]:
+    if not ALLOW_ABS:
+        return []
+    return [as_int_if_possible(abs(v))]
+
+def maybe_fact(v: float | int) -> Iterable[int]:
+    if not ALLOW_FACT:
+        return []
+    # only defined for nonnegative integers within bound
+    if not is_integer(v):
+        return []
+    n = int(v)
+    if n < 0 or n > MAX_FACT:
+        return []
+    return [factorial(n)]  # factorial result is int
+
+# (value, is_int, ((op, value after op), ...)) for each unary variant of a value
+UnaryChain = Tuple[float | int, bool, Tuple[Tuple[str, float | int], ...]]
+
+@lru_cache(maxsize=None)
+def unary_value_closure(v: float | int) -> Tuple[UnaryChain, ...]:
+    """Values reachable from v under {id, abs, fact, abs∘fact}, one entry per distinct value."""
+    variants: List[Tuple[float | int, Tuple[Tuple[str, float | int], ...]]] = [(v, ())]
+    if UNARY_WRAPPING:
+        # Apply abs
+        for i in range(len(variants)):
+            base, chain = variants[i]
+            variants += [(a, chain + (("abs", a),)) for a in maybe_abs(base)]
+        # Apply factorial to both the base and abs-variant (if any)
+        # (abs then fact is common; fact then abs is redundant because fact ≥ 0)
+        more = []
+        for base, chain in variants:
+            more += [(f, chain + (("fact", f),)) for f in maybe_fact(base)]
+        variants += more
+    # Deduplicate by value; the first (shortest) chain wins
+    uniq: Dict[float | int, UnaryChain] = {}
+    for val, chain in variants:
+        if chain and abs(val) > MAX_ABS_VAL:
+            continue
+        uniq.setdefault(val, (val, is_integer(val), chain))
+    return tuple(uniq.values())
+
+def wrap_unaries(e: Expr) -> List[Expr]:
+    """Optionally wrap with abs / factorial, using the cached unary closure of e's value."""
     out: List[Expr] = []
-    # +
-    if RULES["allow_plus"]:
-        v = L.val + R.val
-        out.append(Expr(as_int_if_possible(v), f"({L.text} {SYM_PLUS} {R.text})", is_integer(v)))
-    # -
-    if RULES["allow_minus"]:
-        v = L.val - R.val
-        out.append(Expr(as_int_if_possible(v), f"({L.text} {SYM_MINUS} {R.text})", is_integer(v)))
-    # *
-    if RULES["allow_times"]:
-        v = L.val * R.val
-        out.append(Expr(as_int_if_possible(v), f"({L.text} {SYM_TIMES} {R.text})", is_integer(v)))
-    # %
-    if RULES["allow_mod"]:
-        if L.is_int and R.is_int:
-            r = int(R.val)
-            if r != 0:
-                v = int(L.val) % r
-                out.append(Expr(int(v), f"({L.text} {SYM_MOD} {R.text})", True))
-    # ^
-    if RULES["allow_pow"]:
-        ok, v = safe_pow(L.val, R.val)
-        if ok:
-            out.append(Expr(as_int_if_possible(v), f"({L.text} {SYM_POW} {R.text})", is_integer(v)))
+    for val, val_is_int, chain in unary_value_closure(e.val):
+        nid = e.node
+        for op, step in chain:
+            nid = POOL.intern(Node(step, op, nid, -1))
+        out.append(Expr(val, nid, val_is_int) if chain else e)
     return out
 
-def wrap_unaries(e: Expr) -> List[Expr]:
-    """Optionally wrap with abs / factorial; include combos lightly to avoid blow-up."""
-    variants = [e]
-    if not RULES["enable_unary_wrapping"]:
-        return variants
-    # Apply abs
-    for base in list(variants):
-        variants += list(base.maybe_abs())
-    # Apply factorial to both the base and abs-variant (if any)
-    # (abs then fact is common; fact then abs is redundant because fact ≥ 0)
-    more: List[Expr] = []
-    for v in variants:
-        more += list(v.maybe_fact())
-    variants += more
-    # Deduplicate by (val, text)
-    uniq: Dict[Tuple[str, str], Expr] = {}
-    for v in variants:
-        key = (str(v.val), v.text)
-        uniq[key] = v
-    return list(uniq.values())
+def combine_exprs(L: Expr, R: Expr, results: Dict[float | int, Expr],
+                  raw_seen: Set[float | int]) -> List[Expr]:
+    """Add every (L op R) and its unary wraps whose value is not in results yet.
+
+    Returns the added Exprs. Pool nodes are only interned for these winners, after
+    the value check, so discarded candidates never touch POOL. raw_seen holds the
+    binary results already expanded for this slice: their whole unary closure is in
+    results, so a repeat is skipped before the closure is even looked up.
+    """
+    added: List[Expr] = []
+    for v, sym in combine_binary(L, R):
+        if v in raw_seen:
+            continue
+        raw_seen.add(v)
+        node = -1
+        for val, val_is_int, chain in unary_value_closure(v):
+            # hash-cons by value: one representative per value is
+            # enough for equality solving, first text wins. The raw
+            # value is the key (no str()): equal ints/floats and ±0.0
+            # share a slot. NaN always fails the MAX_ABS_VAL check; inf
+            # only gets through when max_abs_value is None
+            if val in results:
+                continue
+            if node < 0:
+                node = POOL.intern(Node(v, sym, L.node, R.node))
+            nid = node
+            for op, step in chain:
+                nid = POOL.intern(Node(step, op, nid, -1))
+            e = Expr(val, nid, val_is_int)
+            results[val] = e
+            added.append(e)
+    return added
+
+# Snapshot the default RULES now that everything apply_rules() touches is defined
+apply_rules()
 
 # ==========================
 # Expression generator
 # ==========================
-def build_exprs(nums: List[int]) -> List[Expr]:
-    """All expressions from an ordered list of digits using allowed binary ops and parentheses."""
-    if len(nums) == 1:
-        base = Expr(nums[0], str(nums[0]), True)
-        return wrap_unaries(base)
-
-    results: Dict[Tuple[str, str], Expr] = {}
-    N = len(nums)
-    for split in range(1, N):
-        left_nums = nums[:split]
-        right_nums = nums[split:]
-        left_exprs = build_exprs(left_nums)
-        right_exprs = build_exprs(right_nums)
-        for L in left_exprs:
+@lru_cache(maxsize=None)
+def split_plan(n: int) -> Tuple[Tuple[int, int], ...]:
+    """Every multi-digit slice (i, j) of n digits, ordered by width.
+
+    A slice [i:j] is [i:k] op [k:j] for each i < k < j, so walking the plan in order
+    finishes both operand slices before they are used.
+    """
+    return tuple(
+        (i, i + width)
+        for width in range(2, n + 1)
+        for i in range(n - width + 1)
+    )
+
+SliceTable = Dict[Tuple[int, int], Dict[float | int, Expr]]
+
+def slice_exprs(table: SliceTable, i: int, j: int) -> Iterator[Expr]:
+    """Expressions over digits[i:j] from the finished operand slices in table.
+
+    Yielded as they are made, one per value (first text wins).
+    """
+    results: Dict[float | int, Expr] = {}
+    raw_seen: Set[float | int] = set()
+    for k in range(i + 1, j):
+        right_exprs = table[k, j].values()
+        for L in table[i, k].values():
             for R in right_exprs:
-                for comb in combine_binary(L, R):
-                    for w in wrap_unaries(comb):
-                        # key by value and text to prune duplicates
-                        key = (str(w.val), w.text)
-                        results[key] = w
-    return list(results.values())
-
-def values_equal(a: float | int, b: float | int) -> bool:
-    if is_integer(a) and is_integer(b):
-        return int(a) == int(b)
-    return isclose(float(a), float(b), rel_tol=0, abs_tol=RULES["eq_tol"])
+                yield from combine_exprs(L, R, results, raw_seen)
+
+def build_table(digits: Tuple[int, ...]) -> SliceTable:
+    """All expressions for every slice of digits that is an operand of a wider one.
+
+    One table per plate, built bottom-up over split_plan (no recursion), so each
+    slice is built exactly once. Slices n-1 digits wide or more are never operands
+    of a "=" side, so they are left for side_exprs to stream.
+    """
+    n = len(digits)
+    table: SliceTable = {}
+    for i, d in enumerate(digits):
+        base = Expr(d, POOL.intern(Node(d, "", -1, -1)), True)
+        table[i, i + 1] = {w.val: w for w in wrap_unaries(base)}
+
+    for i, j in split_plan(n):
+        if j - i >= n - 1:
+            break
+        table[i, j] = {e.val: e for e in slice_exprs(table, i, j)}
+    return table
+
+def side_exprs(table: SliceTable, i: int, j: int) -> Iterable[Expr]:
+    """Expressions for one side of "=": from table, or streamed if the slice isn't kept."""
+    if (i, j) in table:
+        return table[i, j].values()
+    return slice_exprs(table, i, j)
+
+def probe_matches(stream: Iterable[Expr], side: Iterable[Expr]) -> Iterator[Tuple[Expr, Expr]]:
+    """Pairs (S, T) with equal values, for S from stream and T from side."""
+    # Integer values of side are matched exactly, so a dict probe replaces the
+    # pairwise scan; non-integer ones still go through values_equal
+    by_val: Dict[int, List[Expr]] = defaultdict(list)
+    floats: List[Expr] = []
+    targets: List[Expr] = []
+    for T in side:
+        targets.append(T)
+        if T.is_int:
+            by_val[T.val].append(T)
+        else:
+            floats.append(T)
+
+    for S in stream:
+        if S.is_int:
+            for T in by_val.get(S.val, ()):
+                yield S, T
+            # floats is empty unless RULES allow non-integer values
+            for T in floats:
+                if values_equal(S, T):
+                    yield S, T
+        else:
+            for T in targets:
+                if values_equal(S, T):
+                    yield S, T
+
+def values_equal(L: Expr, R: Expr) -> bool:
+    # both int-tagged: exact compare, no type checks needed
+    if L.is_int and R.is_int:
+        return L.val == R.val
+    return isclose(float(L.val), float(R.val), rel_tol=0, abs_tol=EQ_TOL)
 
 # ==========================
 # Solver
 # ==========================
-def solve_plate(d1: int, d2: int, d3: int, d4: int) -> List[str]:
+def find_solutions(d1: int, d2: int, d3: int, d4: int) -> Set[str]:
     """
-    Try all "=" positions and report equations LHS = RHS that evaluate true.
+    Try all "=" positions and collect equations LHS = RHS that evaluate true.
     No digit concatenation; order fixed.
     """
-    digits = [int(d1), int(d2), int(d3), int(d4)]
+    digits = (int(d1), int(d2), int(d3), int(d4))
     solutions: Set[str] = set()
+    # RULES may have changed since the last call
+    apply_rules()
+    POOL.clear()
+
+    n = len(digits)
+    table = build_table(digits)
 
     # "=" can go after 1st, 2nd, or 3rd digit
     for eq_pos in (1, 2, 3):
-        L_nums = digits[:eq_pos]
-        R_nums = digits[eq_pos:]
-        L_exprs = build_exprs(L_nums)
-        R_exprs = build_exprs(R_nums)
+        L_exprs = side_exprs(table, 0, eq_pos)
+        R_exprs = side_exprs(table, eq_pos, n)
+        # The longer side is streamed into probes against the shorter one
+        if eq_pos >= n - eq_pos:
+            pairs = probe_matches(L_exprs, R_exprs)
+        else:
+            pairs = ((L, R) for R, L in probe_matches(R_exprs, L_exprs))
+
+        for L, R in pairs:
+            eq = f"{L.text} {SYM_EQ} {R.text}"
+            # Normalize outer parentheses for prettiness
+            eq = prettify(eq)
+            solutions.add(eq)
 
-        for L in L_exprs:
-            for R in R_exprs:
-                if values_equal(L.val, R.val):
-                    eq = f"{L.text} {SYM_EQ} {R.text}"
-                    # Normalize outer parentheses for prettiness
-                    eq = prettify(eq)
-                    solutions.add(eq)
+    return solutions
 
-    return sorted(solutions, key=len)  # short/cute first
+def rank_solutions(solutions: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """Short/cute first; with a limit only the `limit` shortest are selected (no full sort)."""
+    if limit is None:
+        return sorted(solutions, key=len)
+    return heapq.nsmallest(limit, solutions, key=len)
+
+def solve_plate(d1: int, d2: int, d3: int, d4: int, limit: Optional[int] = None) -> List[str]:
+    """Solutions for the plate, shortest first; at most `limit` of them if given."""
+    return rank_solutions(find_solutions(d1, d2, d3, d4), limit)
 
 def prettify(s: str) -> str:
     # Remove superfluous outer parentheses around single numbers like "(3)" → "3"
     # Gentle cleanup to keep output readable.
-    changed = True
-    while changed:
-        changed = False
-        if s.startswith("(") and s.endswith(")"):
-            # Count paren balance to see if outermost pair encloses all
-            bal = 0
-            ok = True
-            for i, ch in enumerate(s):
-                if ch == "(":
-                    bal += 1
-                elif ch == ")":
-                    bal -= 1
-                if bal == 0 and i != len(s) - 1:
-                    ok = False
-                    break
-            if ok:
-                s = s[1:-1]
-                changed = True
+    # One pass pairs every "(" with its ")", then all enclosing outer pairs are
+    # stripped in a single slice.
+    n = len(s)
+    match: Dict[int, int] = {}
+    stack: List[int] = []
+    for i, ch in enumerate(s):
+        if ch == "(":
+            stack.append(i)
+        elif ch == ")" and stack:
+            match[stack.pop()] = i
+    k = 0
+    while k < n // 2 and s[k] == "(" and match.get(k) == n - 1 - k:
+        k += 1
     # Replace "×" with * in code-like contexts? We keep the pretty symbol.
-    return s
+    return s[k:n - k]
 
 # ==========================
 # CLI
 # ==========================
 def main():
     import argparse
+
+    def non_negative_int(text: str) -> int:
+        n = int(text)
+        if n < 0:
+            raise argparse.ArgumentTypeError("must be >= 0")
+        return n
+
     ap = argparse.ArgumentParser(description="Solve PlateEquals for 4 digits (order fixed).")
     ap.add_argument("digits", nargs=1, help="Four-digit sequence, e.g., 4312 (no spaces)")
-    ap.add_argument("--limit", type=int, default=10, help="Max lines to print")
+    ap.add_argument("--limit", type=non_negative_int, default=10, help="Max lines to print")
     args = ap.parse_args()
 
     dstr = args.digits[0].strip()
@@ -250,12 +487,12 @@ def main():
         raise SystemExit("Provide exactly four digits, e.g., 4312")
 
     d1, d2, d3, d4 = map(int, list(dstr))
-    sols = solve_plate(d1, d2, d3, d4)
+    sols = find_solutions(d1, d2, d3, d4)
     if not sols:
         print("No solutions under current RULES.")
         return
     print(f"Found {len(sols)} solution(s):")
-    for i, eq in enumerate(sols[:args.limit], 1):
+    for i, eq in enumerate(rank_solutions(sols, args.limit), 1):
         print(f"{i:3d}. {eq}")
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+import math
+import unittest
+from functools import lru_cache
+
+import plate_parity
+
+
+def evaluate(text):
+    """Value and digit count of a rendered side, e.g. "|(4 - (3)!)|"."""
+    pos = 0
+
+    def expr():
+        nonlocal pos
+        ch = text[pos]
+        if ch.isdigit():
+            pos += 1
+            return int(ch), 1
+        if ch == "|":
+            pos += 1
+            v, n = expr()
+            pos += 1  # closing "|"
+            return abs(v), n
+        pos += 1  # "("
+        left, n_left = expr()
+        if text[pos] == ")":
+            pos += 2  # ")!"
+            return math.factorial(left), n_left
+        op = text[pos + 1]
+        pos += 3
+        right, n_right = expr()
+        pos += 1  # ")"
+        if op == "+":
+            v = left + right
+        elif op == "-":
+            v = left - right
+        elif op == "×":
+            v = left * right
+        else:
+            v = left ** right
+        return v, n_left + n_right
+
+    return expr()
+
+
+def baseline_unary(v):
+    out = {v, abs(v)}
+    for x in (v, abs(v)):
+        if 0 <= x <= 8:
+            out.add(math.factorial(x))
+    return out
+
+
+@lru_cache(maxsize=None)
+def baseline_values(nums):
+    """Every value the original exhaustive search reaches under the default RULES."""
+    if len(nums) == 1:
+        return frozenset(baseline_unary(nums[0]))
+    out = set()
+    for k in range(1, len(nums)):
+        for a in baseline_values(nums[:k]):
+            for b in baseline_values(nums[k:]):
+                combos = [a + b, a - b, a * b]
+                if 0 <= b <= 6:
+                    combos.append(a ** b)
+                for v in combos:
+                    out |= baseline_unary(v)
+    return frozenset(out)
+
+
+class SolvePlateTest(unittest.TestCase):
+    def setUp(self):
+        self.saved = dict(plate_parity.RULES)
+
+    def tearDown(self):
+        plate_parity.RULES.clear()
+        plate_parity.RULES.update(self.saved)
+        plate_parity.apply_rules()
+
+    def test_4312(self):
+        self.assertEqual(set(plate_parity.solve_plate(4, 3, 1, 2)), {
+            "4 = (3 - (1 - 2))",
+            "(4 - (3 - 1)) = 2",
+            "(4 - 3) = |(1 - 2)|",
+            "|(4 - (3)!)| = (1 × 2)",
+            "(4)! = ((3 - (1 - 2)))!",
+        })
+
+    def test_matches_baseline_on_all_plates(self):
+        # one equation per matched value and "=" position, same values as the
+        # original exhaustive search (which had no magnitude cap)
+        plate_parity.RULES["max_abs_value"] = None
+        for n in range(10000):
+            digits = tuple(map(int, f"{n:04d}"))
+            expected = {
+                (e, v)
+                for e in (1, 2, 3)
+                for v in baseline_values(digits[:e]) & baseline_values(digits[e:])
+            }
+            found = set()
+            for eq in plate_parity.find_solutions(*digits):
+                lhs, rhs = eq.split(" = ")
+                (lv, ln), (rv, _) = evaluate(lhs), evaluate(rhs)
+                self.assertEqual(lv, rv, eq)
+                found.add((ln, lv))
+            self.assertEqual(found, expected, digits)
+
+
+class PowRulesTest(unittest.TestCase):
+    def setUp(self):
+        self.saved = dict(plate_parity.RULES)
+
+    def tearDown(self):
+        plate_parity.RULES.clear()
+        plate_parity.RULES.update(self.saved)
+        plate_parity.apply_rules()
+
+    def test_non_integer_exponent_allowed_when_rule_disabled(self):
+        plate_parity.RULES["pow_require_int_exp"] = False
+        plate_parity.RULES["pow_min_exp"] = -2
+        plate_parity.apply_rules()
+        self.assertEqual(plate_parity.safe_pow(4, 0.5, False), (True, 2.0))
+
+        plate_parity.RULES["pow_require_int_exp"] = True
+        plate_parity.apply_rules()
+        self.assertEqual(plate_parity.safe_pow(4, 0.5, False), (False, 0))
+
+
+class MaxAbsValueTest(unittest.TestCase):
+    BIG = "((8)! ^ 2) = ((8)! ^ 2)"
+
+    def setUp(self):
+        self.saved = dict(plate_parity.RULES)
+
+    def tearDown(self):
+        plate_parity.RULES.clear()
+        plate_parity.RULES.update(self.saved)
+        plate_parity.apply_rules()
+
+    def test_default_cap_drops_equations_above_it(self):
+        self.assertNotIn(self.BIG, plate_parity.solve_plate(8, 2, 8, 2))
+
+    def test_no_cap_keeps_them(self):
+        plate_parity.RULES["max_abs_value"] = None
+        self.assertIn(self.BIG, plate_parity.solve_plate(8, 2, 8, 2))
+
+
+class RankSolutionsTest(unittest.TestCase):
+    def test_shortest_first(self):
+        sols = {"(1 + 2) = 3", "3 = 3", "|3| = 3"}
+        self.assertEqual(plate_parity.rank_solutions(sols), ["3 = 3", "|3| = 3", "(1 + 2) = 3"])
+
+    def test_limit_keeps_the_shortest(self):
+        sols = {"(1 + 2) = 3", "3 = 3", "|3| = 3"}
+        self.assertEqual(plate_parity.rank_solutions(sols, 2), ["3 = 3", "|3| = 3"])
+        self.assertEqual(plate_parity.rank_solutions(sols, 0), [])
+
+    def test_solve_plate_limit(self):
+        full = plate_parity.solve_plate(4, 3, 1, 2)
+        limited = plate_parity.solve_plate(4, 3, 1, 2, limit=2)
+        self.assertEqual(len(limited), 2)
+        self.assertLessEqual(set(limited), set(full))
+        self.assertEqual([len(eq) for eq in limited], [len(eq) for eq in full[:2]])
+
+
+if __name__ == "__main__":
+    unittest.main()